@@ -7,21 +7,68 @@ Creates combined VTP files from all components for time series rendering
 import os
 import sys
 import glob
+import logging
 import re
 import xml.etree.ElementTree as ET
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
 
-# Try to import VTK with error handling
-VTK_AVAILABLE = False
+# Progress bar is optional
 try:
-    import vtk
-    VTK_AVAILABLE = True
-    print("VTK library loaded successfully")
-except ImportError as e:
-    print(f"VTK import failed: {e}")
-    print("Please install VTK: pip install vtk")
-except Exception as e:
-    print(f"VTK loading error: {e}")
+    from tqdm import tqdm
+except ImportError:
+    def tqdm(iterable, **kwargs):
+        return iterable
+
+# Per-file and per-timestep details are logged at DEBUG, shown with -v
+logger = logging.getLogger(__name__)
+
+# Component names indexed by the ComponentID point array
+COMPONENT_NAMES = ['none', 'gravityCasting', 'inlet', 'model', 'riser']
+
+# Timestep number in main time series filenames
+_TS_RE = re.compile(r'gravityCasting_(\d+)\.vtk$')
+
+# Timestep number in component filenames, e.g. inlet/inlet_116.vtk
+_COMPONENT_TS_RE = re.compile(r'_(\d+)\.vtk$')
+
+# VTK is imported lazily by load_vtk() - importing it loads every VTK
+# module, which is wasted on usage errors or a missing directory
+VTK_AVAILABLE = False
+vtk = None
+np = None
+numpy_support = None
+
+def load_vtk():
+    """Import VTK with error handling, returns True if it is available"""
+    global VTK_AVAILABLE, vtk, np, numpy_support
+    if VTK_AVAILABLE:
+        return True
+    
+    try:
+        import vtk
+        import numpy as np
+        from vtk.util import numpy_support
+        VTK_AVAILABLE = True
+        logger.debug("VTK library loaded successfully")
+    except ImportError as e:
+        print(f"VTK import failed: {e}")
+        print("Please install VTK: pip install vtk")
+    except Exception as e:
+        print(f"VTK loading error: {e}")
+    
+    return VTK_AVAILABLE
+
+def _np_points(poly_data):
+    """Points of a dataset as an (n, 3) numpy view, without copying"""
+    return numpy_support.vtk_to_numpy(poly_data.GetPoints().GetData()).reshape(-1, 3)
+
+def configure_logging(verbose):
+    """Show per-file and per-timestep details on stderr when verbose"""
+    if verbose and not logger.handlers:
+        logger.addHandler(logging.StreamHandler())
+        logger.setLevel(logging.DEBUG)
 
 class CombinedVTKConverter:
     def __init__(self, base_path):
@@ -29,13 +76,29 @@ class CombinedVTKConverter:
         self.output_dir = self.base_path / "vtp_output"
         self.output_dir.mkdir(exist_ok=True)
         
+        # Surface filter reused for every conversion, built on first use
+        self._surface_filter = None
+        
+        # Last converted polydata per component with its (path, mtime) key,
+        # so static component geometry is only read and converted once
+        self._poly_cache = {}
+        
     def extract_timestep_from_filename(self, filename):
-        """Extract timestep number from filename"""
-        match = re.search(r'gravityCasting_(\d+)\.vtk', str(filename))
-        return int(match.group(1)) if match else 0
+        """Extract timestep number from filename, None if it has none"""
+        if not isinstance(filename, str):
+            filename = os.fspath(filename)
+        match = _TS_RE.search(filename)
+        return int(match.group(1)) if match else None
     
     def get_timestep_files(self):
-        """Get all files organized by timestep"""
+        """Get all files organized by timestep
+
+        Returns the main file per timestep, the component files per
+        timestep ({timestep: {component: path}}) and the sorted timesteps.
+        A component directory holding a single file is static geometry and
+        is used for every timestep; otherwise each component file is matched
+        to a timestep by the number in its name.
+        """
         print(f"\n=== Scanning for VTK files in: {self.base_path} ===")
         
         # Find main time series files
@@ -43,32 +106,39 @@ class CombinedVTKConverter:
         main_files = glob.glob(main_pattern)
         
         # Extract unique timesteps from main files
-        timesteps = set()
-        main_by_timestep = {}
-        
-        for f in main_files:
-            timestep = self.extract_timestep_from_filename(f)
-            timesteps.add(timestep)
-            main_by_timestep[timestep] = f
+        main_by_timestep = {
+            timestep: f for f in main_files
+            if (timestep := self.extract_timestep_from_filename(f)) is not None
+        }
+        timesteps = sorted(main_by_timestep)
         
         print(f"Found {len(main_files)} main gravityCasting files")
-        print(f"Timesteps: {sorted(timesteps)}")
+        print(f"Timesteps: {timesteps}")
         
         # Check component directories
         components = ['inlet', 'model', 'riser']
-        component_files = {}
+        files_by_timestep = {timestep: {} for timestep in timesteps}
         
         for component in components:
             comp_dir = self.base_path / component
-            if comp_dir.exists():
-                vtk_files = list(comp_dir.glob("*.vtk"))
-                component_files[component] = sorted(vtk_files)
-                print(f"{component}: {len(vtk_files)} files")
-            else:
+            if not comp_dir.exists():
                 print(f"{component}: directory not found")
-                component_files[component] = []
+                continue
+            
+            vtk_files = sorted(comp_dir.glob("*.vtk"))
+            if len(vtk_files) == 1:
+                print(f"{component}: 1 file (static)")
+                for timestep in timesteps:
+                    files_by_timestep[timestep][component] = vtk_files[0]
+                continue
+            
+            print(f"{component}: {len(vtk_files)} files")
+            for f in vtk_files:
+                m = _COMPONENT_TS_RE.search(f.name)
+                if m and int(m.group(1)) in files_by_timestep:
+                    files_by_timestep[int(m.group(1))][component] = f
         
-        return main_by_timestep, component_files, sorted(timesteps)
+        return main_by_timestep, files_by_timestep, timesteps
     
     def safe_read_vtk(self, filepath):
         """Safely read VTK file"""
@@ -76,38 +146,31 @@ class CombinedVTKConverter:
             return None
             
         filepath = str(filepath)
-        print(f"  Reading: {Path(filepath).name}", end=" ... ")
+        name = Path(filepath).name
         
         try:
-            # Try generic reader first
-            reader = vtk.vtkDataSetReader()
+            # Generic reader detects the dataset type from the header and
+            # returns the matching subclass in a single parse
+            reader = vtk.vtkGenericDataObjectReader()
             reader.SetFileName(filepath)
+            reader.ReadAllScalarsOn()
             reader.Update()
             
             data = reader.GetOutput()
-            if data and data.GetNumberOfPoints() > 0:
-                print(f"OK ({data.GetNumberOfPoints()} points)")
-                return data
-            
-            # Try unstructured grid reader
-            reader = vtk.vtkUnstructuredGridReader()
-            reader.SetFileName(filepath)
-            reader.Update()
-            data = reader.GetOutput()
-            
-            if data and data.GetNumberOfPoints() > 0:
-                print(f"OK ({data.GetNumberOfPoints()} points)")
+            if data and data.IsA('vtkDataSet') and data.GetNumberOfPoints() > 0:
+                logger.debug("  Read: %s (%d points)", name, data.GetNumberOfPoints())
                 return data
                 
         except Exception as e:
-            print(f"FAILED: {e}")
+            logger.warning("  Reading %s FAILED: %s", name, e)
+            return None
             
-        print("FAILED")
+        logger.warning("  Reading %s FAILED: no points", name)
         return None
     
     def convert_to_polydata(self, data, component_name=""):
         """Convert VTK data to polydata and add component info"""
-        if not data:
+        if not data or data.GetNumberOfPoints() == 0:
             return None
             
         try:
@@ -115,90 +178,186 @@ class CombinedVTKConverter:
             if data.GetClassName() == 'vtkPolyData':
                 poly_data = data
             else:
-                geom_filter = vtk.vtkGeometryFilter()
-                geom_filter.SetInputData(data)
-                geom_filter.Update()
-                poly_data = geom_filter.GetOutput()
+                # Surface filter handles every dataset type in one pass
+                if self._surface_filter is None:
+                    self._surface_filter = vtk.vtkDataSetSurfaceFilter()
+                    self._surface_filter.SetFastMode(True)
+                    self._surface_filter.SetPassThroughPointIds(False)
+                surface_filter = self._surface_filter
+                surface_filter.SetInputData(data)
+                surface_filter.Update()
                 
-                if poly_data.GetNumberOfPoints() == 0:
-                    # Try surface filter
-                    surface_filter = vtk.vtkDataSetSurfaceFilter()
-                    surface_filter.SetInputData(data)
-                    surface_filter.Update()
-                    poly_data = surface_filter.GetOutput()
+                # Detach the result, the next Update() reuses the output
+                poly_data = vtk.vtkPolyData()
+                poly_data.ShallowCopy(surface_filter.GetOutput())
+                surface_filter.SetInputData(None)
             
-            # Add component identification if we have points
-            if poly_data.GetNumberOfPoints() > 0 and component_name:
-                # Add part ID for visualization/filtering
-                n_points = poly_data.GetNumberOfPoints()
-                part_id_array = vtk.vtkIntArray()
-                part_id_array.SetName("ComponentID")
-                part_id_array.SetNumberOfTuples(n_points)
-                
+            # Datasets without cells have no surface
+            n_points = poly_data.GetNumberOfPoints()
+            if n_points == 0:
+                return None
+            
+            # Add component identification
+            if component_name:
                 # Assign unique ID based on component
-                component_ids = {
-                    'gravityCasting': 1,
-                    'inlet': 2, 
-                    'model': 3,
-                    'riser': 4
-                }
-                comp_id = component_ids.get(component_name, 0)
-                part_id_array.Fill(comp_id)
-                poly_data.GetPointData().AddArray(part_id_array)
+                if component_name in COMPONENT_NAMES:
+                    comp_id = COMPONENT_NAMES.index(component_name)
+                else:
+                    comp_id = 0
                 
-                # Add component name as string array
-                comp_array = vtk.vtkStringArray()
-                comp_array.SetName("ComponentName")
-                comp_array.SetNumberOfTuples(n_points)
-                for i in range(n_points):
-                    comp_array.SetValue(i, component_name)
-                poly_data.GetPointData().AddArray(comp_array)
+                # Single allocation, wrapped without copying; numpy_support
+                # keeps the numpy buffer referenced from the VTK array
+                ids = np.full(n_points, comp_id, dtype=np.int32)
+                part_id_array = numpy_support.numpy_to_vtk(ids, deep=False,
+                                                           array_type=vtk.VTK_INT)
+                part_id_array.SetName("ComponentID")
+                poly_data.GetPointData().AddArray(part_id_array)
             
-            return poly_data if poly_data.GetNumberOfPoints() > 0 else None
+            return poly_data
             
         except Exception as e:
-            print(f"    Conversion failed: {e}")
+            logger.warning("    Conversion failed: %s", e)
             return None
     
+    def component_polydata(self, component, filepath):
+        """Read and convert a component file, reusing the previous result
+
+        When a component resolves to the same unchanged file as last time
+        (static geometry), the polydata converted then is returned as is.
+        Its arrays are identical and merging only reads from it.
+        """
+        filepath = os.path.abspath(filepath)
+        try:
+            key = (filepath, os.path.getmtime(filepath))
+        except OSError:
+            key = None
+        
+        cached = self._poly_cache.get(component)
+        if key and cached and cached[0] == key:
+            logger.debug("  Reused: %s", Path(filepath).name)
+            return cached[1]
+        
+        data = self.safe_read_vtk(filepath)
+        poly_data = self.convert_to_polydata(data, component) if data else None
+        if key and poly_data:
+            self._poly_cache[component] = (key, poly_data)
+        return poly_data
+    
+    def merge_polydata(self, poly_datas):
+        """Merge disjoint polydata in a single pass
+
+        Output sizes are known upfront, so every point, cell and attribute
+        array is allocated once and filled by slicing numpy views of the
+        inputs. Cell connectivity is shifted by each input's point offset.
+        Only attribute arrays present in every input are kept.
+        """
+        merged = vtk.vtkPolyData()
+        
+        # Points
+        points = np.concatenate([_np_points(pd) for pd in poly_datas])
+        vtk_points = vtk.vtkPoints()
+        vtk_points.SetData(numpy_support.numpy_to_vtk(points, deep=False))
+        merged.SetPoints(vtk_points)
+        
+        point_counts = [pd.GetNumberOfPoints() for pd in poly_datas]
+        point_offsets = np.cumsum([0] + point_counts[:-1])
+        
+        # Cells - vtkPolyData orders them verts, lines, polys, strips
+        id_dtype = numpy_support.get_numpy_array_type(vtk.VTK_ID_TYPE)
+        cell_segments = []
+        cell_starts = [0] * len(poly_datas)
+        
+        for cell_type in ('Verts', 'Lines', 'Polys', 'Strips'):
+            offset_parts = [np.zeros(1, dtype=id_dtype)]
+            connectivity_parts = []
+            connectivity_size = 0
+            
+            for i, pd in enumerate(poly_datas):
+                cells = getattr(pd, 'Get' + cell_type)()
+                n_cells = cells.GetNumberOfCells()
+                cell_segments.append((i, cell_starts[i], cell_starts[i] + n_cells))
+                cell_starts[i] += n_cells
+                if n_cells == 0:
+                    continue
+                
+                offsets = numpy_support.vtk_to_numpy(cells.GetOffsetsArray())
+                connectivity = numpy_support.vtk_to_numpy(cells.GetConnectivityArray())
+                offset_parts.append(offsets[1:] + connectivity_size)
+                connectivity_parts.append(connectivity + point_offsets[i])
+                connectivity_size += len(connectivity)
+            
+            if not connectivity_parts:
+                continue
+            
+            cell_array = vtk.vtkCellArray()
+            cell_array.SetData(
+                numpy_support.numpy_to_vtk(np.concatenate(offset_parts), deep=False,
+                                           array_type=vtk.VTK_ID_TYPE),
+                numpy_support.numpy_to_vtk(np.concatenate(connectivity_parts), deep=False,
+                                           array_type=vtk.VTK_ID_TYPE))
+            getattr(merged, 'Set' + cell_type)(cell_array)
+        
+        # Point and cell attributes
+        point_segments = [(i, 0, n) for i, n in enumerate(point_counts)]
+        self._merge_attribute_arrays([pd.GetPointData() for pd in poly_datas],
+                                     point_segments, merged.GetPointData())
+        self._merge_attribute_arrays([pd.GetCellData() for pd in poly_datas],
+                                     cell_segments, merged.GetCellData())
+        
+        return merged
+    
+    def _merge_attribute_arrays(self, attributes, segments, target):
+        """Concatenate arrays common to all inputs into target
+
+        segments lists (input index, start, stop) tuple ranges in output order.
+        """
+        first = attributes[0]
+        for j in range(first.GetNumberOfArrays()):
+            array = first.GetArray(j)
+            # Skip string arrays (GetArray returns None) and bit arrays
+            if array is None or array.GetDataType() == vtk.VTK_BIT:
+                continue
+            
+            name = array.GetName()
+            inputs = [attrs.GetArray(name) for attrs in attributes]
+            if any(a is None
+                   or a.GetDataType() != array.GetDataType()
+                   or a.GetNumberOfComponents() != array.GetNumberOfComponents()
+                   for a in inputs):
+                continue
+            
+            views = [numpy_support.vtk_to_numpy(a) for a in inputs]
+            values = np.concatenate([views[i][start:stop] for i, start, stop in segments])
+            merged_array = numpy_support.numpy_to_vtk(values, deep=False,
+                                                      array_type=array.GetDataType())
+            merged_array.SetName(name)
+            target.AddArray(merged_array)
+    
     def combine_timestep_data(self, timestep, main_file, component_files):
         """Combine all components for a single timestep"""
-        print(f"\n--- Processing Timestep {timestep} ---")
+        logger.debug("--- Processing Timestep %d ---", timestep)
         
-        append_filter = vtk.vtkAppendPolyData()
-        total_points = 0
-        components_added = 0
+        poly_datas = []
         
-        # Add main gravityCasting file
+        # Main gravityCasting file first, then the component files
+        # resolved for this timestep
+        inputs = []
         if main_file and os.path.exists(main_file):
-            data = self.safe_read_vtk(main_file)
-            if data:
-                poly_data = self.convert_to_polydata(data, "gravityCasting")
-                if poly_data:
-                    append_filter.AddInputData(poly_data)
-                    total_points += poly_data.GetNumberOfPoints()
-                    components_added += 1
-        
-        # Add component files (use timestep as index if available)
-        for component, files in component_files.items():
-            if timestep < len(files) and files:
-                # Use timestep as index into component files
-                comp_file = files[timestep] if timestep < len(files) else files[0]
-                data = self.safe_read_vtk(comp_file)
-                if data:
-                    poly_data = self.convert_to_polydata(data, component)
-                    if poly_data:
-                        append_filter.AddInputData(poly_data)
-                        total_points += poly_data.GetNumberOfPoints()
-                        components_added += 1
-        
-        if components_added == 0:
-            print(f"  No valid data for timestep {timestep}")
+            inputs.append(("gravityCasting", main_file))
+        inputs.extend(component_files.items())
+        
+        for component, filepath in inputs:
+            poly_data = self.component_polydata(component, filepath)
+            if poly_data:
+                poly_datas.append(poly_data)
+        
+        if not poly_datas:
+            logger.warning("  No valid data for timestep %d", timestep)
             return None
         
         # Combine all components
         try:
-            append_filter.Update()
-            combined_data = append_filter.GetOutput()
+            combined_data = self.merge_polydata(poly_datas)
             
             # Add timestep information
             timestep_array = vtk.vtkFloatArray()
@@ -207,37 +366,64 @@ class CombinedVTKConverter:
             timestep_array.SetValue(0, float(timestep))
             combined_data.GetFieldData().AddArray(timestep_array)
             
-            print(f"  Combined: {components_added} components, {total_points} total points")
+            # Name lookup table for ComponentID
+            names_array = vtk.vtkStringArray()
+            names_array.SetName("ComponentNames")
+            names_array.SetNumberOfTuples(len(COMPONENT_NAMES))
+            for i, name in enumerate(COMPONENT_NAMES):
+                names_array.SetValue(i, name)
+            combined_data.GetFieldData().AddArray(names_array)
+            
+            logger.debug("  Combined: %d components, %d total points",
+                         len(poly_datas), combined_data.GetNumberOfPoints())
             return combined_data
             
         except Exception as e:
-            print(f"  Combine failed: {e}")
+            logger.warning("  Combine failed: %s", e)
             return None
     
-    def write_vtp(self, poly_data, output_path):
-        """Write polydata to VTP file"""
+    def write_vtp(self, poly_data, output_path, data_mode="appended"):
+        """Write polydata to VTP file
+
+        data_mode is "appended" (raw zlib-compressed blob, default),
+        "binary" (inline base64) or "ascii" (largest, slowest to write).
+        """
         try:
             writer = vtk.vtkXMLPolyDataWriter()
             writer.SetFileName(str(output_path))
             writer.SetInputData(poly_data)
-            writer.SetDataModeToAscii()  # Better compatibility
+            if data_mode == "ascii":
+                writer.SetDataModeToAscii()
+            else:
+                if data_mode == "binary":
+                    writer.SetDataModeToBinary()
+                else:
+                    writer.SetDataModeToAppended()
+                    writer.EncodeAppendedDataOff()
+                writer.SetCompressorTypeToZLib()
+                writer.SetCompressionLevel(1)
             writer.Write()
             
-            print(f"  Saved: {output_path.name}")
+            logger.debug("  Saved: %s", output_path.name)
             return True
             
         except Exception as e:
-            print(f"  Write failed: {e}")
+            logger.warning("  Write failed: %s", e)
             return False
     
-    def convert_all_timesteps(self):
-        """Main conversion process - creates combined VTP files only"""
-        if not VTK_AVAILABLE:
+    def convert_all_timesteps(self, max_workers=None):
+        """Main conversion process - creates combined VTP files only
+
+        Timesteps are independent, so they are converted in a process pool
+        (one worker per CPU by default). max_workers=1 converts serially in
+        this process.
+        """
+        if not load_vtk():
             print("ERROR: VTK library not available")
             return
         
         # Get all files organized by timestep
-        main_by_timestep, component_files, timesteps = self.get_timestep_files()
+        main_by_timestep, files_by_timestep, timesteps = self.get_timestep_files()
         
         if not timesteps:
             print("No timesteps found!")
@@ -245,39 +431,130 @@ class CombinedVTKConverter:
         
         print(f"\n=== Converting {len(timesteps)} timesteps to combined VTP files ===")
         
-        successful_conversions = 0
+        if max_workers is None:
+            max_workers = os.cpu_count() or 1
+        max_workers = min(max_workers, len(timesteps))
         
-        for timestep in timesteps:
-            main_file = main_by_timestep.get(timestep)
-            
-            # Combine all components for this timestep
-            combined_data = self.combine_timestep_data(timestep, main_file, component_files)
-            
-            if combined_data:
-                # Write combined VTP file
-                output_file = self.output_dir / f"combined_timestep_{timestep:04d}.vtp"
-                if self.write_vtp(combined_data, output_file):
-                    successful_conversions += 1
+        main_files = [main_by_timestep.get(timestep) for timestep in timesteps]
+        component_files = [files_by_timestep[timestep] for timestep in timesteps]
+        
+        if max_workers <= 1:
+            results = self.convert_serial(timesteps, main_files, component_files)
+        else:
+            verbose = logger.isEnabledFor(logging.DEBUG)
+            with ProcessPoolExecutor(max_workers=max_workers,
+                                     initializer=_init_worker,
+                                     initargs=(self.base_path, verbose)) as executor:
+                results = list(tqdm(executor.map(_process_timestep, timesteps, main_files,
+                                                 component_files),
+                                    total=len(timesteps), unit='ts'))
+        
+        written = [timestep for timestep, ok in zip(timesteps, results) if ok]
+        pvd_file = self.write_pvd(written) if written else None
         
         print(f"\n=== Conversion Complete ===")
-        print(f"Successfully created {successful_conversions} combined VTP files")
+        print(f"Successfully created {len(written)} combined VTP files")
         print(f"Output directory: {self.output_dir}")
         print(f"Files: combined_timestep_XXXX.vtp")
+        if pvd_file:
+            print(f"Time series collection: {pvd_file.name}")
         print("\nReady for time series rendering!")
 
+    def convert_serial(self, timesteps, main_files, component_files, max_pending_writes=2):
+        """Convert timesteps in this process, returns a success flag per timestep
+
+        main_files and component_files hold each timestep's inputs, in the
+        same order as timesteps.
+
+        Writing is disk-bound and VTK releases the GIL while writing, so
+        each VTP is written on a background thread while the next timestep
+        is read and combined. At most max_pending_writes combined datasets
+        are held in memory waiting to be written.
+        """
+        results = [False] * len(timesteps)
+        pending = deque()
+        
+        with ThreadPoolExecutor(max_workers=1) as writer_pool:
+            inputs = enumerate(zip(timesteps, main_files, component_files))
+            for i, (timestep, main_file, files) in tqdm(inputs, total=len(timesteps), unit='ts'):
+                combined_data = self.combine_timestep_data(timestep, main_file, files)
+                if not combined_data:
+                    continue
+                
+                if len(pending) >= max_pending_writes:
+                    j, future = pending.popleft()
+                    results[j] = future.result()
+                pending.append((i, writer_pool.submit(self.write_vtp, combined_data,
+                                                      self.output_path(timestep))))
+            
+            for j, future in pending:
+                results[j] = future.result()
+        
+        return results
+    
+    def process_timestep(self, timestep, main_file, component_files):
+        """Combine and write a single timestep, returns True on success"""
+        # Combine all components for this timestep
+        combined_data = self.combine_timestep_data(timestep, main_file, component_files)
+        
+        if not combined_data:
+            return False
+        
+        # Write combined VTP file
+        return self.write_vtp(combined_data, self.output_path(timestep))
+    
+    def write_pvd(self, timesteps):
+        """Write a .pvd collection referencing each timestep's VTP file
+
+        ParaView opens the collection as a single time series and only
+        loads the VTP of the timestep being shown.
+        """
+        root = ET.Element("VTKFile", type="Collection", version="0.1",
+                          byte_order="LittleEndian")
+        collection = ET.SubElement(root, "Collection")
+        for timestep in timesteps:
+            ET.SubElement(collection, "DataSet", timestep=str(timestep), group="",
+                          part="0", file=self.output_path(timestep).name)
+        ET.indent(root)
+        
+        pvd_file = self.output_dir / "combined_timesteps.pvd"
+        ET.ElementTree(root).write(pvd_file, encoding="utf-8", xml_declaration=True)
+        return pvd_file
+    
+    def output_path(self, timestep):
+        """Path of the combined VTP file for a timestep"""
+        return self.output_dir / f"combined_timestep_{timestep:04d}.vtp"
+
+# Converter owned by each worker process, so per-instance state outlives
+# a single timestep within that worker
+_worker_converter = None
+
+def _init_worker(base_path, verbose):
+    """Process pool initializer - build this worker's converter"""
+    global _worker_converter
+    configure_logging(verbose)
+    load_vtk()
+    _worker_converter = CombinedVTKConverter(base_path)
+
+def _process_timestep(timestep, main_file, component_files):
+    """Process pool task - convert one timestep in a worker process"""
+    return _worker_converter.process_timestep(timestep, main_file, component_files)
+
 def main():
-    if len(sys.argv) < 2:
-        print("Usage: python3 vtkToVtp.py <VTK_directory_path>")
+    args = [arg for arg in sys.argv[1:] if arg not in ("-v", "--verbose")]
+    if not args:
+        print("Usage: python3 vtkToVtp.py [-v] <VTK_directory_path>")
         print("Example: python3 vtkToVtp.py VTK")
         sys.exit(1)
     
-    vtk_path = sys.argv[1]
+    configure_logging(len(args) < len(sys.argv) - 1)
+    vtk_path = args[0]
     
     if not os.path.exists(vtk_path):
         print(f"Error: Directory '{vtk_path}' does not exist")
         sys.exit(1)
     
-    if not VTK_AVAILABLE:
+    if not load_vtk():
         print("VTK not available. Install with: pip install vtk")
         sys.exit(1)
     